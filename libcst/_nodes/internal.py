@@ -4,9 +4,17 @@
 # LICENSE file in the root directory of this source tree.
 
 
-from contextlib import contextmanager
+from contextlib import nullcontext
 from dataclasses import dataclass, field
-from typing import Iterable, Iterator, List, Optional, Sequence, TYPE_CHECKING, Union
+from typing import (
+    ContextManager,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Union,
+)
 
 from libcst._add_slots import add_slots
 from libcst._flatten_sentinel import FlattenSentinel
@@ -20,6 +28,10 @@ if TYPE_CHECKING:
     from libcst._visitors import CSTVisitorT
 
 
+# nullcontext is stateless, so a single instance can be shared by every node.
+_NULL_CONTEXT: ContextManager[None] = nullcontext()
+
+
 @add_slots
 @dataclass(frozen=False)
 class CodegenState:
@@ -59,15 +71,16 @@ class CodegenState:
             # last token (if we're not an empty file) is a newline.
             self.tokens.pop()
 
-    @contextmanager
     def record_syntactic_position(
         self,
         node: "CSTNode",
         *,
         start_node: Optional["CSTNode"] = None,
         end_node: Optional["CSTNode"] = None,
-    ) -> Iterator[None]:
-        yield
+    ) -> ContextManager[None]:
+        # Positions are only tracked by the metadata providers' subclasses. Don't
+        # create a new generator-based context manager for every node otherwise.
+        return _NULL_CONTEXT
 
 
 def visit_required(
@@ -4,10 +4,9 @@
 # LICENSE file in the root directory of this source tree.
 
 import inspect
-import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional, Pattern, Sequence, Union
+from typing import Optional, Sequence, Union
 
 from libcst._add_slots import add_slots
 from libcst._maybe_sentinel import MaybeSentinel
@@ -63,7 +62,9 @@ from libcst._nodes.whitespace import (
 )
 from libcst._visitors import CSTVisitorT
 
-_INDENT_WHITESPACE_RE: Pattern[str] = re.compile(r"[ \f\t]+", re.UNICODE)
+# The characters that may make up an indent. Validated with str.strip instead of
+# a regular expression, since it's a simple character set.
+_INDENT_WHITESPACE: str = " \f\t"
 
 
 class BaseSuite(CSTNode, ABC):
@@ -212,9 +213,12 @@ class Break(BaseSmallStatement):
     semicolon: Union[Semicolon, MaybeSentinel] = MaybeSentinel.DEFAULT
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Break":
-        return Break(
-            semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor)
-        )
+        semicolon = visit_sentinel(self, "semicolon", self.semicolon, visitor)
+        # Our only child is usually a MaybeSentinel, so avoid allocating an identical
+        # copy of ourselves when the visitor didn't change anything.
+        if semicolon is self.semicolon:
+            return self
+        return Break(semicolon=semicolon)
 
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
@@ -223,7 +227,7 @@ class Break(BaseSmallStatement):
             state.add_token("break")
 
         semicolon = self.semicolon
-        if isinstance(semicolon, MaybeSentinel):
+        if semicolon is MaybeSentinel.DEFAULT:
             if default_semicolon:
                 state.add_token("; ")
         elif isinstance(semicolon, Semicolon):
@@ -243,9 +247,12 @@ class Continue(BaseSmallStatement):
     semicolon: Union[Semicolon, MaybeSentinel] = MaybeSentinel.DEFAULT
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Continue":
-        return Continue(
-            semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor)
-        )
+        semicolon = visit_sentinel(self, "semicolon", self.semicolon, visitor)
+        # Our only child is usually a MaybeSentinel, so avoid allocating an identical
+        # copy of ourselves when the visitor didn't change anything.
+        if semicolon is self.semicolon:
+            return self
+        return Continue(semicolon=semicolon)
 
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
@@ -254,7 +261,7 @@ class Continue(BaseSmallStatement):
             state.add_token("continue")
 
         semicolon = self.semicolon
-        if isinstance(semicolon, MaybeSentinel):
+        if semicolon is MaybeSentinel.DEFAULT:
             if default_semicolon:
                 state.add_token("; ")
         elif isinstance(semicolon, Semicolon):
@@ -295,12 +302,22 @@ class Return(BaseSmallStatement):
                 raise CSTValidationError("Must have at least one space after 'return'.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Return":
+        whitespace_after_return = visit_sentinel(
+            self, "whitespace_after_return", self.whitespace_after_return, visitor
+        )
+        value = visit_optional(self, "value", self.value, visitor)
+        semicolon = visit_sentinel(self, "semicolon", self.semicolon, visitor)
+        # Avoid allocating an identical copy of ourselves if no child was replaced.
+        if (
+            whitespace_after_return is self.whitespace_after_return
+            and value is self.value
+            and semicolon is self.semicolon
+        ):
+            return self
         return Return(
-            whitespace_after_return=visit_sentinel(
-                self, "whitespace_after_return", self.whitespace_after_return, visitor
-            ),
-            value=visit_optional(self, "value", self.value, visitor),
-            semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor),
+            whitespace_after_return=whitespace_after_return,
+            value=value,
+            semicolon=semicolon,
         )
 
     def _codegen_impl(
@@ -319,7 +336,7 @@ class Return(BaseSmallStatement):
                 value._codegen(state)
 
         semicolon = self.semicolon
-        if isinstance(semicolon, MaybeSentinel):
+        if semicolon is MaybeSentinel.DEFAULT:
             if default_semicolon:
                 state.add_token("; ")
         elif isinstance(semicolon, Semicolon):
@@ -686,7 +703,7 @@ class IndentedBlock(BaseSuite):
                 raise CSTValidationError(
                     "An indented block must have a non-zero width indent."
                 )
-            if _INDENT_WHITESPACE_RE.fullmatch(indent) is None:
+            if indent.strip(_INDENT_WHITESPACE):
                 raise CSTValidationError(
                     "An indent must be composed of only whitespace characters."
                 )
@@ -2407,28 +2424,30 @@ class Raise(BaseSmallStatement):
     semicolon: Union[Semicolon, MaybeSentinel] = MaybeSentinel.DEFAULT
 
     def _validate(self) -> None:
-        # Validate correct construction
-        if self.exc is None and self.cause is not None:
-            raise CSTValidationError(
-                "Must have an 'exc' when specifying 'clause'. on Raise."
-            )
+        exc = self.exc
+        cause = self.cause
+        if exc is None:
+            # Validate correct construction. A bare ``raise`` has nothing else to
+            # validate, so we can bail out early.
+            if cause is not None:
+                raise CSTValidationError(
+                    "Must have an 'exc' when specifying 'clause'. on Raise."
+                )
+            return
 
         # Validate spacing between "raise" and "exc"
-        exc = self.exc
-        if exc is not None:
-            whitespace_after_raise = self.whitespace_after_raise
-            has_no_gap = (
-                not isinstance(whitespace_after_raise, MaybeSentinel)
-                and whitespace_after_raise.empty
-            )
-            if has_no_gap and not exc._safe_to_use_with_word_operator(
-                ExpressionPosition.RIGHT
-            ):
-                raise CSTValidationError("Must have at least one space after 'raise'.")
+        whitespace_after_raise = self.whitespace_after_raise
+        has_no_gap = (
+            not isinstance(whitespace_after_raise, MaybeSentinel)
+            and whitespace_after_raise.empty
+        )
+        if has_no_gap and not exc._safe_to_use_with_word_operator(
+            ExpressionPosition.RIGHT
+        ):
+            raise CSTValidationError("Must have at least one space after 'raise'.")
 
         # Validate spacing between "exc" and "from"
-        cause = self.cause
-        if exc is not None and cause is not None:
+        if cause is not None:
             whitespace_before_from = cause.whitespace_before_from
             has_no_gap = (
                 not isinstance(whitespace_before_from, MaybeSentinel)
@@ -2440,13 +2459,25 @@ class Raise(BaseSmallStatement):
                 raise CSTValidationError("Must have at least one space before 'from'.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Raise":
+        whitespace_after_raise = visit_sentinel(
+            self, "whitespace_after_raise", self.whitespace_after_raise, visitor
+        )
+        exc = visit_optional(self, "exc", self.exc, visitor)
+        cause = visit_optional(self, "cause", self.cause, visitor)
+        semicolon = visit_sentinel(self, "semicolon", self.semicolon, visitor)
+        # Avoid allocating an identical copy of ourselves if no child was replaced.
+        if (
+            whitespace_after_raise is self.whitespace_after_raise
+            and exc is self.exc
+            and cause is self.cause
+            and semicolon is self.semicolon
+        ):
+            return self
         return Raise(
-            whitespace_after_raise=visit_sentinel(
-                self, "whitespace_after_raise", self.whitespace_after_raise, visitor
-            ),
-            exc=visit_optional(self, "exc", self.exc, visitor),
-            cause=visit_optional(self, "cause", self.cause, visitor),
-            semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor),
+            whitespace_after_raise=whitespace_after_raise,
+            exc=exc,
+            cause=cause,
+            semicolon=semicolon,
         )
 
     def _codegen_impl(
@@ -2468,7 +2499,7 @@ class Raise(BaseSmallStatement):
                 cause._codegen(state, default_space=" ")
 
         semicolon = self.semicolon
-        if isinstance(semicolon, MaybeSentinel):
+        if semicolon is MaybeSentinel.DEFAULT:
             if default_semicolon:
                 state.add_token("; ")
         elif isinstance(semicolon, Semicolon):
@@ -2764,7 +2795,7 @@ class Match(BaseCompoundStatement):
                 raise CSTValidationError(
                     "A match statement must have a non-zero width indent."
                 )
-            if _INDENT_WHITESPACE_RE.fullmatch(indent) is None:
+            if indent.strip(_INDENT_WHITESPACE):
                 raise CSTValidationError(
                     "An indent must be composed of only whitespace characters."
                 )
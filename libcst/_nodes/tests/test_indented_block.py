@@ -148,6 +148,13 @@ class IndentedBlockTest(CSTNodeTest):
                 ),
                 "only whitespace",
             ),
+            (
+                lambda: cst.IndentedBlock(
+                    (cst.SimpleStatementLine((cst.Pass(),)),),
+                    indent="\t\n ",
+                ),
+                "only whitespace",
+            ),
         )
     )
     def test_invalid(
@@ -3,8 +3,11 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+from typing import Union
+
 import libcst as cst
 from libcst._nodes.tests.base import CSTNodeTest
+from libcst.helpers import ensure_type
 from libcst.testing.utils import data_provider
 
 
@@ -14,3 +17,33 @@ class LeafSmallStatementsTest(CSTNodeTest):
     )
     def test_valid(self, node: cst.CSTNode, code: str) -> None:
         self.validate_node(node, code)
+
+    @data_provider(((cst.Break(),), (cst.Continue(),)))
+    def test_visit_unchanged(self, node: cst.CSTNode) -> None:
+        # A no-op transformer shouldn't need to rebuild nodes whose only child is a
+        # sentinel.
+        self.assertIs(node.visit(cst.CSTTransformer()), node)
+
+    @data_provider(
+        (
+            (cst.Break(semicolon=cst.Semicolon()),),
+            (cst.Continue(semicolon=cst.Semicolon()),),
+        )
+    )
+    def test_visit_changed(self, node: Union[cst.Break, cst.Continue]) -> None:
+        class WidenSemicolon(cst.CSTTransformer):
+            def leave_Semicolon(
+                self, original_node: cst.Semicolon, updated_node: cst.Semicolon
+            ) -> cst.Semicolon:
+                return updated_node.with_changes(
+                    whitespace_after=cst.SimpleWhitespace("  ")
+                )
+
+        new_node = ensure_type(node.visit(WidenSemicolon()), type(node))
+        self.assertIsNot(new_node, node)
+        whitespace_after = ensure_type(
+            new_node.semicolon, cst.Semicolon
+        ).whitespace_after
+        self.assertEqual(
+            ensure_type(whitespace_after, cst.SimpleWhitespace).value, "  "
+        )
@@ -121,6 +121,34 @@ class RaiseConstructionTest(CSTNodeTest):
     def test_invalid(self, **kwargs: Any) -> None:
         self.assert_invalid(**kwargs)
 
+    @data_provider(
+        (
+            (cst.Raise(),),
+            (cst.Raise(whitespace_after_raise=cst.SimpleWhitespace(" ")),),
+        )
+    )
+    def test_visit_unchanged(self, node: cst.Raise) -> None:
+        # Only nodes whose children are all leaves or sentinels come back untouched,
+        # since visiting e.g. a Name always produces a new Name.
+        self.assertIs(node.visit(cst.CSTTransformer()), node)
+
+    def test_visit_changed(self) -> None:
+        class RenameCause(cst.CSTTransformer):
+            def leave_Name(
+                self, original_node: cst.Name, updated_node: cst.Name
+            ) -> cst.Name:
+                if original_node.value == "cause":
+                    return updated_node.with_changes(value="other")
+                return updated_node
+
+        node = cst.Raise(cst.Name("exc"), cst.From(cst.Name("cause")))
+        new_node = ensure_type(node.visit(RenameCause()), cst.Raise)
+        self.assertIsNot(new_node, node)
+        self.assertEqual(
+            ensure_type(ensure_type(new_node.cause, cst.From).item, cst.Name).value,
+            "other",
+        )
+
 
 class RaiseParsingTest(CSTNodeTest):
     @data_provider(
@@ -8,6 +8,7 @@ from typing import Any
 import libcst as cst
 from libcst import parse_statement
 from libcst._nodes.tests.base import CSTNodeTest
+from libcst.helpers import ensure_type
 from libcst.metadata import CodeRange
 from libcst.testing.utils import data_provider
 
@@ -43,6 +44,34 @@ class ReturnCreateTest(CSTNodeTest):
     def test_invalid(self, **kwargs: Any) -> None:
         self.assert_invalid(**kwargs)
 
+    @data_provider(
+        (
+            (cst.Return(),),
+            (cst.Return(whitespace_after_return=cst.SimpleWhitespace(" ")),),
+        )
+    )
+    def test_visit_unchanged(self, node: cst.Return) -> None:
+        # Only nodes whose children are all leaves or sentinels come back untouched,
+        # since visiting e.g. a Name always produces a new Name.
+        self.assertIs(node.visit(cst.CSTTransformer()), node)
+
+    def test_visit_changed(self) -> None:
+        class WidenWhitespace(cst.CSTTransformer):
+            def leave_SimpleWhitespace(
+                self,
+                original_node: cst.SimpleWhitespace,
+                updated_node: cst.SimpleWhitespace,
+            ) -> cst.SimpleWhitespace:
+                return updated_node.with_changes(value="  ")
+
+        node = cst.Return(whitespace_after_return=cst.SimpleWhitespace(" "))
+        new_node = ensure_type(node.visit(WidenWhitespace()), cst.Return)
+        self.assertIsNot(new_node, node)
+        self.assertEqual(
+            ensure_type(new_node.whitespace_after_return, cst.SimpleWhitespace).value,
+            "  ",
+        )
+
 
 class ReturnParseTest(CSTNodeTest):
     @data_provider(